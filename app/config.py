@@ -2,7 +2,8 @@
 Configuration management using Pydantic Settings.
 Environment variables are loaded from .env file.
 """
-from typing import Optional
+from functools import cached_property, lru_cache
+from typing import NamedTuple, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -40,11 +41,41 @@ class Settings(BaseSettings):
         case_sensitive=True,
     )
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> list[str]:
-        """Parse CORS_ORIGINS string to list."""
+        """Parse CORS_ORIGINS string to list (computed once)."""
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the cached settings instance (parses .env only once)."""
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
+
+
+class RuntimeConfig(NamedTuple):
+    """
+    Read-only snapshot of the settings used on hot request paths.
+    Plain tuple attribute access avoids Pydantic model machinery.
+    """
+    GROQ_API_KEY: str
+    GOOGLE_PLACES_API_KEY: str
+    GOOGLE_PLACES_BASE_URL: str
+    REDIS_URL: str
+    LOG_LEVEL: str
+    CORS_ORIGINS_LIST: tuple
+
+
+# Hot-path snapshot of the settings above
+runtime = RuntimeConfig(
+    GROQ_API_KEY=settings.GROQ_API_KEY,
+    GOOGLE_PLACES_API_KEY=settings.GOOGLE_PLACES_API_KEY,
+    GOOGLE_PLACES_BASE_URL=settings.GOOGLE_PLACES_BASE_URL,
+    REDIS_URL=settings.REDIS_URL,
+    LOG_LEVEL=settings.LOG_LEVEL,
+    CORS_ORIGINS_LIST=tuple(settings.cors_origins_list),
+)
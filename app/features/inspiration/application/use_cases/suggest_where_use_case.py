@@ -17,6 +17,9 @@ class SuggestWhereUseCase:
     Orchestrates calls to Google Places API.
     """
     
+    # Above this radius a single query truncates too much; use tiling
+    TILED_SEARCH_RADIUS_M = 10_000.0
+    
     def __init__(self, places_provider: GooglePlacesProvider):
         """Initialize use case with dependencies."""
         self.places_provider = places_provider
@@ -36,8 +39,15 @@ class SuggestWhereUseCase:
         """
         logger.info(f"Executing SuggestWhereUseCase with query: {search_params.text_query}")
         
-        # Call Google Places API
-        venues = await self.places_provider.search_by_text(search_params)
+        # Call Google Places API; broad searches fan out over sub-tiles to
+        # get past the 20-results-per-query cap
+        if (
+            search_params.max_result_count > 20
+            or search_params.location_radius > self.TILED_SEARCH_RADIUS_M
+        ):
+            venues = await self.places_provider.search_tiled(search_params)
+        else:
+            venues = await self.places_provider.search_by_text(search_params)
         
         # TODO: Future enhancements
         # - Filter based on user preferences from DB
@@ -42,6 +42,13 @@ class SuggestWishlistUseCase:
         """
         logger.info(f"Executing SuggestWishlistUseCase for event: {event_name}")
 
+        # Obvious garbage never reaches the LLM: too short or purely
+        # numeric event names get an empty suggestion immediately
+        stripped = event_name.strip()
+        if len(stripped) < 3 or stripped.isdigit():
+            logger.info(f"Skipping LLM call for low-signal event name: {event_name!r}")
+            return WishlistSuggestion(event_name=event_name, items=[])
+
         # Call Groq provider to generate items
         items = await self.groq_provider.generate_wishlist(
             event_name=event_name,
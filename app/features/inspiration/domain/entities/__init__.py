@@ -2,6 +2,6 @@
 from .location import Location
 from .venue import Venue
 from .search_params import SearchParams
-from .wishlist_suggestion import WishlistSuggestion, WishlistItem
+from .wishlist_suggestion import WishlistSuggestion
 
-__all__ = ["Location", "Venue", "SearchParams", "WishlistSuggestion", "WishlistItem"]
+__all__ = ["Location", "Venue", "SearchParams", "WishlistSuggestion"]
@@ -1,9 +1,8 @@
 """Location entity representing geographic coordinates."""
-from dataclasses import dataclass
+import msgspec
 
 
-@dataclass
-class Location:
+class Location(msgspec.Struct, frozen=True):
     """Geographic location with latitude and longitude."""
     latitude: float
     longitude: float
@@ -1,11 +1,60 @@
 """Search parameters for Google Places API."""
-from dataclasses import dataclass, field
-from typing import Optional, List
+import msgspec
+from typing import Callable, Dict, Optional, List
 from .location import Location
 
 
-@dataclass
-class SearchParams:
+# Request builders specialized per "shape" (which optional fields are set).
+# The set of active fields is stable per caller, so each shape's builder is
+# generated once with only the needed branches inlined.
+_BUILDERS: Dict[tuple, Callable[["SearchParams"], dict]] = {}
+
+
+def _compile_builder(shape: tuple) -> Callable[["SearchParams"], dict]:
+    """Generate a request builder containing only the branches this shape needs."""
+    has_bias, has_type, has_min_rating, has_prices, open_now, has_region = shape
+
+    lines = [
+        "def _builder(p):",
+        "    request = {",
+        '        "textQuery": p.text_query,',
+        '        "maxResultCount": min(p.max_result_count, 20),  # API limit',
+        '        "languageCode": p.language,',
+        "    }",
+    ]
+    if has_bias:
+        lines += [
+            '    request["locationBias"] = {',
+            '        "circle": {',
+            '            "center": p.location_bias.to_dict(),',
+            '            "radius": p.location_radius,',
+            "        }",
+            "    }",
+        ]
+    if has_type:
+        lines += [
+            '    request["includedType"] = p.included_type',
+            '    request["useStrictTypeFiltering"] = p.use_strict_type_filtering',
+        ]
+    if has_min_rating:
+        lines.append('    request["minRating"] = p.min_rating')
+    if has_prices:
+        lines.append('    request["priceLevels"] = p.price_levels')
+    if open_now:
+        lines.append('    request["openNow"] = True')
+    if has_region:
+        lines.append('    request["regionCode"] = p.region_code')
+    lines += [
+        '    request["rankPreference"] = p.rank_preference',
+        "    return request",
+    ]
+
+    namespace: dict = {}
+    exec("\n".join(lines), namespace)
+    return namespace["_builder"]
+
+
+class SearchParams(msgspec.Struct):
     """
     Parameters for Google Places Text Search API.
     Maps our domain requirements to Google Places API format.
@@ -34,38 +83,15 @@ class SearchParams:
     
     def to_google_api_request(self) -> dict:
         """Convert to Google Places API request format."""
-        request = {
-            "textQuery": self.text_query,
-            "maxResultCount": min(self.max_result_count, 20),  # API limit
-            "languageCode": self.language,
-        }
-        
-        # Location bias (circle)
-        if self.location_bias:
-            request["locationBias"] = {
-                "circle": {
-                    "center": self.location_bias.to_dict(),
-                    "radius": self.location_radius,
-                }
-            }
-        
-        # Filters
-        if self.included_type:
-            request["includedType"] = self.included_type
-            request["useStrictTypeFiltering"] = self.use_strict_type_filtering
-        
-        if self.min_rating is not None:
-            request["minRating"] = self.min_rating
-        
-        if self.price_levels:
-            request["priceLevels"] = self.price_levels
-        
-        if self.is_open_now:
-            request["openNow"] = True
-        
-        if self.region_code:
-            request["regionCode"] = self.region_code
-        
-        request["rankPreference"] = self.rank_preference
-        
-        return request
+        shape = (
+            self.location_bias is not None,
+            bool(self.included_type),
+            self.min_rating is not None,
+            bool(self.price_levels),
+            self.is_open_now,
+            bool(self.region_code),
+        )
+        builder = _BUILDERS.get(shape)
+        if builder is None:
+            builder = _BUILDERS[shape] = _compile_builder(shape)
+        return builder(self)
@@ -1,28 +1,17 @@
 """
 Domain entities for wishlist suggestions.
 """
-from dataclasses import dataclass
 from typing import List
 
+import msgspec
 
-@dataclass
-class WishlistItem:
-    """Represents a single item suggestion for an event."""
 
-    name: str
-
-    def __str__(self) -> str:
-        return self.name
-
-
-@dataclass
-class WishlistSuggestion:
+class WishlistSuggestion(msgspec.Struct):
     """Represents a complete wishlist suggestion for an event."""
 
     event_name: str
     items: List[str]
+    item_count: int = 0
 
-    @property
-    def item_count(self) -> int:
-        """Returns the number of suggested items."""
-        return len(self.items)
+    def __post_init__(self):
+        self.item_count = len(self.items)
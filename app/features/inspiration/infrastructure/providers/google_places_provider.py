@@ -1,8 +1,13 @@
 """Google Places API client implementation."""
+import asyncio
+import math
+import cachetools
 import httpx
 import logging
+import msgspec
+import orjson
 from typing import List, Optional, Dict, Any
-from app.config import settings
+from app.config import runtime
 from app.shared.exceptions import (
     GooglePlacesAPIError,
     RateLimitError,
@@ -15,46 +20,104 @@ from app.features.inspiration.domain.entities.search_params import SearchParams
 
 logger = logging.getLogger(__name__)
 
+# Shared empty-dict guard for optional sub-objects in place payloads
+_EMPTY: Dict[str, Any] = {}
+
+# Interned Location instances; identical coordinates recur across
+# overlapping searches and Location is frozen, so sharing is safe
+_LOCATION_CACHE: cachetools.LRUCache = cachetools.LRUCache(maxsize=4096)
+
+
+def _mk_location(latitude: float, longitude: float) -> Location:
+    """Get an interned Location for these coordinates."""
+    key = (latitude, longitude)
+    location = _LOCATION_CACHE.get(key)
+    if location is None:
+        location = _LOCATION_CACHE[key] = Location(latitude, longitude)
+    return location
+
+# Field mask for optimal cost/data balance
+FIELD_MASK = ",".join([
+    # Essentials (cheapest)
+    "places.id",
+    "places.name",
+
+    # Pro SKU
+    "places.displayName",
+    "places.formattedAddress",
+    "places.location",
+    "places.types",
+    "places.viewport",
+    "places.googleMapsUri",
+
+    # Enterprise SKU
+    "places.rating",
+    "places.userRatingCount",
+    "places.priceLevel",
+    "places.websiteUri",
+    "places.nationalPhoneNumber",
+    "places.currentOpeningHours",
+    "places.businessStatus",
+
+    # Pagination
+    "nextPageToken",
+])
+
+# Static header portion; only the API key varies per provider
+_BASE_HEADERS = {
+    "Content-Type": "application/json",
+    "X-Goog-FieldMask": FIELD_MASK,
+}
+
+# Module-wide HTTP client so every provider instance shares one warm
+# connection pool; HTTP/2 multiplexes parallel tile searches over it
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Get (or lazily rebuild) the shared Places HTTP client."""
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            http2=True,
+            # Per-phase timeouts: most Places responses arrive in <500ms,
+            # so fail fast on stalled connects instead of holding a
+            # worker for a blanket 30s
+            timeout=httpx.Timeout(connect=2.0, read=10.0, write=2.0, pool=1.0),
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50,
+            ),
+        )
+    return _CLIENT
+
 
 class GooglePlacesProvider:
     """
     Client for Google Places API Text Search.
     Handles HTTP requests, error handling, and response parsing.
     """
-    
-    # Field mask for optimal cost/data balance
-    FIELD_MASK = ",".join([
-        # Essentials (cheapest)
-        "places.id",
-        "places.name",
-        
-        # Pro SKU
-        "places.displayName",
-        "places.formattedAddress",
-        "places.location",
-        "places.types",
-        "places.viewport",
-        "places.googleMapsUri",
-        
-        # Enterprise SKU
-        "places.rating",
-        "places.userRatingCount",
-        "places.priceLevel",
-        "places.websiteUri",
-        "places.nationalPhoneNumber",
-        "places.currentOpeningHours",
-        "places.businessStatus",
-        
-        # Pagination
-        "nextPageToken",
-    ])
-    
-    def __init__(self, api_key: str = None, base_url: str = None):
+
+    def __init__(self, api_key: str = None, base_url: str = None, search_cache_ttl: int = 60):
         """Initialize Google Places provider."""
-        self.api_key = api_key or settings.GOOGLE_PLACES_API_KEY
-        self.base_url = base_url or settings.GOOGLE_PLACES_BASE_URL
+        self.api_key = api_key or runtime.GOOGLE_PLACES_API_KEY
+        self.base_url = base_url or runtime.GOOGLE_PLACES_BASE_URL
         self.endpoint = f"{self.base_url}/places:searchText"
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self._headers = {**_BASE_HEADERS, "X-Goog-Api-Key": self.api_key}
+        # Successful searches are cached briefly so retries and polling
+        # UIs skip both the round-trip and the parse
+        self._search_cache = cachetools.TTLCache(maxsize=256, ttl=search_cache_ttl)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        The shared HTTP client, resolved per access.
+
+        Never cached on the instance: if some instance closes the shared
+        pool, _get_client() rebuilds it and nobody is left holding a
+        stale reference.
+        """
+        return _get_client()
     
     async def search_by_text(
         self,
@@ -74,22 +137,50 @@ class GooglePlacesProvider:
             RateLimitError: When rate limit exceeded
             AuthenticationError: On auth failures
         """
-        headers = {
-            "Content-Type": "application/json",
-            "X-Goog-Api-Key": self.api_key,
-            "X-Goog-FieldMask": self.FIELD_MASK,
-        }
-        
         body = params.to_google_api_request()
 
-        logger.info(f"Searching Google Places: {body.get('textQuery')}")
-        logger.debug(f"Full Google Places request body: {body}")
-        
+        logger.info("Searching Google Places: %s", body.get("textQuery"))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Full Google Places request body: %s", body)
+
+        cache_key = orjson.dumps(body, option=orjson.OPT_SORT_KEYS)
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Returning %d cached venues", len(cached))
+            return list(cached)
+
+        data = await self._post_search(body)
+
+        # Parse places from response; map over the free function to
+        # skip per-venue bound-method dispatch
+        venues = list(map(_parse_place_fast, data.get("places", ())))
+
+        # Only successful, fully-parsed results are cached
+        self._search_cache[cache_key] = venues
+
+        logger.info("Found %d venues", len(venues))
+        return venues
+
+    async def _post_search(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        POST one Text Search request and return the decoded payload.
+
+        Args:
+            body: Google Places API request body
+
+        Returns:
+            Decoded response payload
+
+        Raises:
+            GooglePlacesAPIError: On API errors
+            RateLimitError: When rate limit exceeded
+            AuthenticationError: On auth failures
+        """
         try:
             response = await self.client.post(
                 self.endpoint,
-                headers=headers,
-                json=body,
+                headers=self._headers,
+                content=orjson.dumps(body),
             )
             
             # Handle different error status codes
@@ -101,7 +192,13 @@ class GooglePlacesProvider:
                     response.status_code
                 )
             elif response.status_code >= 400:
-                error_data = response.json() if response.text else {}
+                # Error bodies are parsed from bytes in one pass; gateways
+                # can return non-JSON (e.g. 502 HTML), so decode failures
+                # fall back to a generic message
+                try:
+                    error_data = orjson.loads(response.content) if response.content else {}
+                except orjson.JSONDecodeError:
+                    error_data = {}
                 error_message = error_data.get("error", {}).get("message", "Unknown error")
                 raise GooglePlacesAPIError(
                     f"Google Places API error: {error_message}",
@@ -109,70 +206,203 @@ class GooglePlacesProvider:
                 )
             
             response.raise_for_status()
-            data = response.json()
-            
-            # Parse places from response
-            places_data = data.get("places", [])
-            venues = [self._parse_place(place) for place in places_data]
-            
-            logger.info(f"Found {len(venues)} venues")
-            return venues
+            return orjson.loads(response.content)
             
         except httpx.TimeoutException as e:
-            logger.error(f"Google Places API timeout: {e}")
+            logger.error("Google Places API timeout: %s", e)
             raise GooglePlacesAPIError("Request timeout") from e
         except httpx.HTTPError as e:
-            logger.error(f"HTTP error calling Google Places API: {e}")
+            logger.error("HTTP error calling Google Places API: %s", e)
             raise GooglePlacesAPIError(f"HTTP error: {str(e)}") from e
+
+    async def search_all_pages(
+        self,
+        params: SearchParams,
+        max_pages: int = 3,
+    ) -> List[Venue]:
+        """
+        Execute a Text Search and follow pagination tokens.
+
+        Page tokens are sequential (each comes from the previous
+        response), so pages cannot be fetched fully in parallel; instead
+        the next page's HTTP fetch is started before the current page is
+        parsed, overlapping network wait with parse work.
+
+        Args:
+            params: Search parameters
+            max_pages: Maximum number of pages to fetch
+
+        Returns:
+            Venues from all fetched pages, in API order
+
+        Raises:
+            GooglePlacesAPIError: On API errors
+            RateLimitError: When rate limit exceeded
+            AuthenticationError: On auth failures
+        """
+        body = params.to_google_api_request()
+
+        logger.info("Searching Google Places (paged): %s", body.get("textQuery"))
+
+        venues: List[Venue] = []
+        data = await self._post_search(body)
+        pages = 1
+
+        while True:
+            token = data.get("nextPageToken")
+            fetch_task = None
+            if token and pages < max_pages:
+                # Start the next fetch first so it runs while this page
+                # is being parsed
+                fetch_task = asyncio.create_task(
+                    self._post_search({**body, "pageToken": token})
+                )
+                pages += 1
+
+            venues.extend(map(_parse_place_fast, data.get("places", ())))
+
+            if fetch_task is None:
+                break
+            data = await fetch_task
+
+        logger.info("Found %d venues across %d pages", len(venues), pages)
+        return venues
     
-    def _parse_place(self, place_data: Dict[str, Any]) -> Venue:
+    async def search_tiled(
+        self,
+        params: SearchParams,
+        tiles: int = 4,
+    ) -> List[Venue]:
         """
-        Parse Google Places API response to Venue entity.
-        
+        Fan a broad search out over sub-tiles of the search circle.
+
+        Google Places caps each Text Search at 20 results; splitting the
+        circle into smaller tiles queried in parallel returns more unique
+        venues with wall-clock close to a single call.
+
         Args:
-            place_data: Raw place data from API
-            
+            params: Search parameters (must include location_bias)
+            tiles: Number of sub-tiles to query (currently 4 quadrants)
+
         Returns:
-            Venue entity
+            Deduplicated venues from all tiles, best-rated first
+
+        Raises:
+            GooglePlacesAPIError: When every tile request fails
         """
-        # Location
-        location_data = place_data.get("location", {})
-        location = Location(
-            latitude=location_data.get("latitude", 0.0),
-            longitude=location_data.get("longitude", 0.0),
-        )
-        
-        # Display name
-        display_name_data = place_data.get("displayName", {})
-        display_name = display_name_data.get("text", "Unknown")
-        
-        # Opening hours
-        opening_hours_data = place_data.get("currentOpeningHours", {})
-        opening_hours = None
-        if opening_hours_data:
-            opening_hours = OpeningHours(
-                open_now=opening_hours_data.get("openNow"),
-                weekday_descriptions=opening_hours_data.get("weekdayDescriptions", []),
+        if params.location_bias is None:
+            # No circle to split; fall back to a single query
+            return await self.search_by_text(params)
+
+        center = params.location_bias
+        half_radius = params.location_radius / 2
+
+        # Equirectangular approximation: offset each quadrant center by
+        # half the radius in both axes
+        dlat = half_radius / 111_320.0
+        dlng = half_radius / (111_320.0 * max(math.cos(math.radians(center.latitude)), 1e-6))
+
+        tile_params = [
+            msgspec.structs.replace(
+                params,
+                location_bias=Location(
+                    latitude=center.latitude + sign_lat * dlat,
+                    longitude=center.longitude + sign_lng * dlng,
+                ),
+                location_radius=half_radius,
             )
-        
-        return Venue(
-            place_id=place_data.get("id", ""),
-            name=place_data.get("name", ""),
-            display_name=display_name,
-            address=place_data.get("formattedAddress", ""),
-            location=location,
-            rating=place_data.get("rating"),
-            total_ratings=place_data.get("userRatingCount"),
-            price_level=place_data.get("priceLevel"),
-            types=place_data.get("types", []),
-            business_status=place_data.get("businessStatus"),
-            phone=place_data.get("nationalPhoneNumber"),
-            website=place_data.get("websiteUri"),
-            is_open_now=opening_hours_data.get("openNow") if opening_hours_data else None,
-            opening_hours=opening_hours,
-            google_maps_uri=place_data.get("googleMapsUri"),
+            for sign_lat, sign_lng in ((1, 1), (1, -1), (-1, 1), (-1, -1))[:tiles]
+        ]
+
+        semaphore = asyncio.Semaphore(4)
+
+        async def search_tile(tile: SearchParams) -> List[Venue]:
+            async with semaphore:
+                return await self.search_by_text(tile)
+
+        results = await asyncio.gather(
+            *[search_tile(tile) for tile in tile_params],
+            return_exceptions=True,
         )
-    
+
+        venues_by_id: Dict[str, Venue] = {}
+        errors = []
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning("Tile search failed: %s", result)
+                errors.append(result)
+                continue
+            for venue in result:
+                venues_by_id.setdefault(venue.place_id, venue)
+
+        if not venues_by_id and errors:
+            raise errors[0]
+
+        # Rank the widened candidate pool, then honor the caller's result
+        # cap so tiling never inflates the response size
+        venues = sorted(venues_by_id.values(), key=self._rank_score, reverse=True)
+        venues = venues[:params.max_result_count]
+        logger.info(
+            "Tiled search returning %d venues (from %d unique across %d tiles)",
+            len(venues), len(venues_by_id), tiles,
+        )
+        return venues
+
+    @staticmethod
+    def _rank_score(venue: Venue) -> float:
+        """Rank venues by rating weighted by review volume."""
+        rating = venue.rating or 0.0
+        total = venue.total_ratings or 0
+        return rating * math.log(total + 1)
+
     async def close(self):
-        """Close HTTP client."""
+        """Close the shared HTTP client (call on application shutdown)."""
         await self.client.aclose()
+
+
+def _parse_place_fast(place_data: Dict[str, Any]) -> Venue:
+    """
+    Parse one Google Places result into a Venue entity.
+
+    Module-level free function with positional construction so the hot
+    parse loop avoids bound-method and keyword-binding overhead.
+
+    Args:
+        place_data: Raw place data from API
+
+    Returns:
+        Venue entity
+    """
+    # Bind optional sub-dicts to locals once instead of re-deriving
+    # them per field
+    loc = place_data.get("location") or _EMPTY
+    display_name_data = place_data.get("displayName") or _EMPTY
+    opening_hours_data = place_data.get("currentOpeningHours")
+
+    location = _mk_location(loc.get("latitude", 0.0), loc.get("longitude", 0.0))
+
+    open_now = opening_hours_data.get("openNow") if opening_hours_data else None
+    opening_hours = None
+    if opening_hours_data:
+        opening_hours = OpeningHours(
+            open_now,
+            opening_hours_data.get("weekdayDescriptions", []),
+        )
+
+    return Venue(
+        place_data.get("id", ""),
+        place_data.get("name", ""),
+        display_name_data.get("text", "Unknown"),
+        place_data.get("formattedAddress", ""),
+        location,
+        place_data.get("rating"),
+        place_data.get("userRatingCount"),
+        place_data.get("priceLevel"),
+        place_data.get("types", []),
+        place_data.get("businessStatus"),
+        place_data.get("nationalPhoneNumber"),
+        place_data.get("websiteUri"),
+        open_now,
+        opening_hours,
+        place_data.get("googleMapsUri"),
+    )
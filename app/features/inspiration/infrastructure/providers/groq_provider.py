@@ -1,41 +1,130 @@
 """
 Groq LLM provider for generating wishlist suggestions.
 """
+import asyncio
 import logging
-import json
-from typing import List
+from typing import Dict, List, Tuple
+import cachetools
 import httpx
+import orjson
 
-from app.config import settings
+from app.config import runtime
+from app.shared.cache import RedisResponseCache
 from app.shared.exceptions import LLMAPIError, AuthenticationError, RateLimitError
 
+try:
+    from redisvl.extensions.llmcache import SemanticCache
+    from redisvl.utils.vectorize import HFTextVectorizer
+except ImportError:
+    SemanticCache = None
+    HFTextVectorizer = None
+
 logger = logging.getLogger(__name__)
 
+BATCH_SYSTEM_PROMPT = (
+    "You are a recommendation system. You will receive a JSON object of "
+    'the form {"events": ["<event_name>", ...]} listing one or more events. '
+    "For each event, respond with the list of necessary items. "
+    "Respond in JSON format only. Do not include any explanations or text "
+    "outside the JSON.\n\n"
+    "Output format:\n"
+    "{\n"
+    '  "results": {\n'
+    '    "<event_name>": ["item1", "item2", "item3"],\n'
+    '    "<other_event_name>": ["item1", "item2"]\n'
+    "  }\n"
+    "}"
+)
+
 
 class GroqProvider:
     """Provider for Groq LLM API."""
 
+    # Embedding model shared across instances so the HF weights are only
+    # loaded once per process
+    _vectorizer = None
+
     def __init__(self, api_key: str = None):
         """
         Initialize Groq provider.
 
         Args:
-            api_key: Groq API key. If not provided, uses settings.GROQ_API_KEY
+            api_key: Groq API key. If not provided, uses runtime.GROQ_API_KEY
         """
-        self.api_key = api_key or settings.GROQ_API_KEY
+        self.api_key = api_key or runtime.GROQ_API_KEY
         self.base_url = "https://api.groq.com/openai/v1"
         self.model = "llama-3.1-8b-instant"
+        self.cache = RedisResponseCache()
+        self.llmcache = self._build_semantic_cache()
 
         if not self.api_key:
             raise AuthenticationError("Groq API key is required")
 
+        # Shared client so TCP+TLS connections to Groq are pooled and
+        # reused across requests instead of re-handshaking per call
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=30.0,
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+            },
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30,
+            ),
+        )
+
+        self._batcher = GroqBatcher(self)
+        self._inflight: Dict[Tuple[str, int], asyncio.Future] = {}
+        # Per-process fallback cache; complements Redis for deployments
+        # without it and absorbs repeats within one worker
+        self._local_cache = cachetools.TTLCache(maxsize=1024, ttl=3600)
+
+    async def aclose(self) -> None:
+        """Close the batcher and the pooled HTTP client."""
+        await self._batcher.aclose()
+        await self._client.aclose()
+
+    @classmethod
+    def _build_semantic_cache(cls):
+        """
+        Build the RedisVL semantic cache, or None if unavailable.
+
+        Returns None when redisvl is not installed or Redis cannot be
+        reached, so the provider falls back to exact-match caching only.
+        """
+        if SemanticCache is None:
+            logger.info("redisvl not installed, semantic cache disabled")
+            return None
+
+        try:
+            if cls._vectorizer is None:
+                cls._vectorizer = HFTextVectorizer("redis/langcache-embed-v1")
+
+            return SemanticCache(
+                name="wishlist_cache",
+                redis_url=runtime.REDIS_URL,
+                distance_threshold=0.1,
+                vectorizer=cls._vectorizer,
+            )
+        except Exception as e:
+            logger.warning(f"Semantic cache unavailable, continuing without it: {e}")
+            return None
+
     async def generate_wishlist(
         self,
         event_name: str,
         max_items: int = 10
     ) -> List[str]:
         """
-        Generate wishlist items for an event using Groq LLM.
+        Generate wishlist items for an event, deduplicating identical
+        concurrent requests.
+
+        While one call for a given (event_name, max_items) is in flight,
+        concurrent identical callers await its result instead of issuing
+        their own LLM calls.
 
         Args:
             event_name: The name or description of the event
@@ -49,83 +138,101 @@ class GroqProvider:
             RateLimitError: If rate limit is exceeded
             LLMAPIError: For other API errors
         """
-        try:
-            logger.info(f"Generating wishlist for event: {event_name}")
+        key = (event_name, max_items)
 
-            system_prompt = (
-                "You are a recommendation system. Given the name of an event, "
-                "respond with a list of necessary items in JSON format only. "
-                "Do not include any explanations or text outside the JSON.\n\n"
-                "Output format:\n"
-                "{\n"
-                '  "event": "<event_name_here>",\n'
-                '  "items_needed": [\n'
-                '    "item1",\n'
-                '    "item2",\n'
-                '    "item3"\n'
-                "  ]\n"
-                "}"
-            )
+        local = self._local_cache.get(key)
+        if local is not None:
+            logger.info(f"Local cache hit for event: {event_name}")
+            return list(local)
 
-            payload = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": event_name}
-                ],
-                "temperature": 1,
-                "max_tokens": 1024,
-                "top_p": 1,
-                "stream": False,
-                "response_format": {"type": "json_object"}
-            }
-
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return list(await inflight)
 
-            logger.debug(f"Sending request to Groq API: {self.base_url}/chat/completions")
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            items = await self._generate_wishlist(event_name, max_items)
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved in case no duplicate caller ever awaits it
+            future.exception()
+            raise
+        else:
+            future.set_result(items)
+            self._local_cache[key] = items
+            return items
+        finally:
+            # CancelledError bypasses the except clause above; cancel the
+            # shared future too so duplicate waiters don't hang forever
+            if not future.done():
+                future.cancel()
+            self._inflight.pop(key, None)
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    json=payload,
-                    headers=headers
-                )
+    async def _generate_wishlist(
+        self,
+        event_name: str,
+        max_items: int = 10
+    ) -> List[str]:
+        """
+        Generate wishlist items for an event using Groq LLM.
 
-                if response.status_code == 401:
-                    logger.error("Groq API authentication failed")
-                    raise AuthenticationError("Invalid Groq API key")
+        Args:
+            event_name: The name or description of the event
+            max_items: Maximum number of items to suggest
 
-                if response.status_code == 429:
-                    logger.error("Groq API rate limit exceeded")
-                    raise RateLimitError("Rate limit exceeded for Groq API")
+        Returns:
+            List of suggested item names
 
-                if response.status_code != 200:
-                    error_msg = f"Groq API error: {response.status_code} - {response.text}"
-                    logger.error(error_msg)
-                    raise LLMAPIError(error_msg)
+        Raises:
+            AuthenticationError: If API key is invalid
+            RateLimitError: If rate limit is exceeded
+            LLMAPIError: For other API errors
+        """
+        try:
+            logger.info(f"Generating wishlist for event: {event_name}")
 
-                data = response.json()
-                content = data["choices"][0]["message"]["content"]
+            # Keyed on what the batcher actually sends upstream
+            cache_key = RedisResponseCache.make_key({
+                "model": self.model,
+                "system": BATCH_SYSTEM_PROMPT,
+                "user": event_name,
+                "max_items": max_items,
+                "temperature": 1,
+            })
 
-                logger.debug(f"Groq API response: {content}")
+            cached = await self.cache.get(cache_key)
+            if cached:
+                logger.info(f"Cache hit for event: {event_name}")
+                return orjson.loads(cached)[:max_items]
 
-                # Parse JSON response
+            if self.llmcache is not None:
                 try:
-                    parsed = json.loads(content)
-                    items = parsed.get("items_needed", [])
+                    hits = await self.llmcache.acheck(prompt=event_name, num_results=1)
+                    if hits:
+                        logger.info(f"Semantic cache hit for event: {event_name}")
+                        return orjson.loads(hits[0]["response"])[:max_items]
+                except Exception as e:
+                    logger.warning(f"Semantic cache check failed, calling LLM: {e}")
+
+            items = await self._batcher.submit(event_name)
 
-                    # Limit to max_items
-                    items = items[:max_items]
+            # Limit to max_items
+            items = items[:max_items]
 
-                    logger.info(f"Successfully generated {len(items)} wishlist items")
-                    return items
+            await self.cache.set(cache_key, orjson.dumps(items).decode(), ex=86400)
 
-                except json.JSONDecodeError as e:
-                    logger.error(f"Failed to parse Groq response as JSON: {e}")
-                    raise LLMAPIError(f"Invalid JSON response from Groq: {content}")
+            if self.llmcache is not None:
+                try:
+                    await self.llmcache.astore(
+                        prompt=event_name,
+                        response=orjson.dumps(items).decode(),
+                    )
+                except Exception as e:
+                    logger.warning(f"Semantic cache store failed: {e}")
+
+            logger.info(f"Successfully generated {len(items)} wishlist items")
+            return items
 
         except (AuthenticationError, RateLimitError, LLMAPIError):
             raise
@@ -135,3 +242,162 @@ class GroqProvider:
         except Exception as e:
             logger.exception(f"Unexpected error calling Groq API: {e}")
             raise LLMAPIError(f"Unexpected error: {str(e)}")
+
+    async def complete_batch(self, event_names: List[str]) -> Dict[str, List[str]]:
+        """
+        Run a single chat completion covering several events.
+
+        Args:
+            event_names: Event names coalesced into one request
+
+        Returns:
+            Mapping of event name to its suggested items
+
+        Raises:
+            AuthenticationError: If API key is invalid
+            RateLimitError: If rate limit is exceeded
+            LLMAPIError: For other API errors
+        """
+        payload = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": BATCH_SYSTEM_PROMPT},
+                {
+                    "role": "user",
+                    "content": orjson.dumps({"events": event_names}).decode(),
+                },
+            ],
+            "temperature": 1,
+            "max_tokens": 1024 * len(event_names),
+            "top_p": 1,
+            "stream": False,
+            "response_format": {"type": "json_object"}
+        }
+
+        logger.debug(
+            f"Sending batch of {len(event_names)} events to Groq API: "
+            f"{self.base_url}/chat/completions"
+        )
+
+        response = await self._client.post("/chat/completions", content=orjson.dumps(payload))
+
+        if response.status_code == 401:
+            logger.error("Groq API authentication failed")
+            raise AuthenticationError("Invalid Groq API key")
+
+        if response.status_code == 429:
+            logger.error("Groq API rate limit exceeded")
+            raise RateLimitError("Rate limit exceeded for Groq API")
+
+        if response.status_code != 200:
+            error_msg = f"Groq API error: {response.status_code} - {response.text}"
+            logger.error(error_msg)
+            raise LLMAPIError(error_msg)
+
+        data = orjson.loads(response.content)
+        content = data["choices"][0]["message"]["content"]
+
+        logger.debug(f"Groq API batch response: {content}")
+
+        try:
+            parsed = orjson.loads(content)
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Failed to parse Groq response as JSON: {e}")
+            raise LLMAPIError(f"Invalid JSON response from Groq: {content}")
+
+        return parsed.get("results", {})
+
+
+class GroqBatcher:
+    """
+    Coalesces concurrent wishlist prompts into batched Groq calls.
+
+    Callers submit an event name and await a Future; a background worker
+    drains the queue whenever max_batch items are waiting or max_wait_ms
+    has elapsed since the first, issues one chat completion for the whole
+    batch, and demultiplexes the keyed response back to each caller.
+    """
+
+    def __init__(self, provider: GroqProvider, max_batch: int = 8, max_wait_ms: int = 25):
+        """
+        Initialize the batcher.
+
+        Args:
+            provider: Groq provider used to execute batched completions
+            max_batch: Maximum events coalesced into one request
+            max_wait_ms: Maximum time to wait for more events, in milliseconds
+        """
+        self._provider = provider
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: "asyncio.Queue[Tuple[str, asyncio.Future]]" = asyncio.Queue()
+        self._worker: asyncio.Task = None
+
+    async def submit(self, event_name: str) -> List[str]:
+        """
+        Queue an event and wait for its items from the next batch.
+
+        Args:
+            event_name: The name or description of the event
+
+        Returns:
+            List of suggested item names
+
+        Raises:
+            The exception raised by the underlying batch completion
+        """
+        # Started lazily so the worker binds to the running event loop
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((event_name, future))
+        return await future
+
+    async def aclose(self) -> None:
+        """Stop the background worker."""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+
+    async def _run(self) -> None:
+        """Worker loop: gather a batch, flush it, repeat."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[Tuple[str, "asyncio.Future"]]) -> None:
+        """Execute one batched completion and resolve the waiting futures."""
+        # Deduplicate so repeated event names share one answer
+        event_names = list({name: None for name, _ in batch})
+
+        try:
+            results = await self._provider.complete_batch(event_names)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for event_name, future in batch:
+            if future.done():
+                continue
+            items = results.get(event_name)
+            if isinstance(items, list):
+                future.set_result(items)
+            else:
+                future.set_exception(
+                    LLMAPIError(f"Batch response missing event: {event_name}")
+                )
@@ -1,14 +1,14 @@
 """FastAPI router for inspiration endpoints."""
 import logging
-from fastapi import APIRouter, HTTPException, Depends
+import re
+from functools import lru_cache
+import msgspec
+from fastapi import APIRouter, HTTPException, Depends, Response
 from typing import List
 
 from app.features.inspiration.presentation.schemas import (
     WhereInspirationRequest,
     WhereInspirationResponse,
-    VenueResponse,
-    LocationResponse,
-    OpeningHoursResponse,
     WishlistRequest,
     WishlistResponse,
     ErrorResponse,
@@ -34,10 +34,18 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/inspiration", tags=["Inspiration"])
 
+# Common patterns indicating a location inside the event text:
+# "in Paris", "near Tokyo", "at Barcelona", "around Milano", etc.
+# The \s boundaries avoid false positives like "Cairo" matching "at".
+_LOCATION_KEYWORD_RE = re.compile(r"\s(?:in|near|at|around)\s", re.IGNORECASE)
+
 
 # Dependency injection
+# Providers hold pooled HTTP clients, so they are process-wide singletons
+# rather than per-request instances
+@lru_cache
 def get_places_provider() -> GooglePlacesProvider:
-    """Get Google Places provider instance."""
+    """Get the shared Google Places provider instance."""
     return GooglePlacesProvider()
 
 
@@ -48,8 +56,9 @@ def get_suggest_where_use_case(
     return SuggestWhereUseCase(places_provider=places_provider)
 
 
+@lru_cache
 def get_groq_provider() -> GroqProvider:
-    """Get Groq provider instance."""
+    """Get the shared Groq provider instance."""
     return GroqProvider()
 
 
@@ -62,9 +71,13 @@ def get_suggest_wishlist_use_case(
 
 @router.post(
     "/where",
-    response_model=WhereInspirationResponse,
     responses={
-        200: {"description": "Successful response with venue suggestions"},
+        # Response is serialized directly with msgspec, so the model is
+        # declared here for OpenAPI docs only
+        200: {
+            "model": WhereInspirationResponse,
+            "description": "Successful response with venue suggestions",
+        },
         400: {"model": ErrorResponse, "description": "Invalid request"},
         429: {"model": ErrorResponse, "description": "Rate limit exceeded"},
         500: {"model": ErrorResponse, "description": "Server error"},
@@ -91,14 +104,16 @@ async def suggest_where(
         
         # Execute use case
         venues = await use_case.execute(search_params)
-        
-        # Convert to response format
-        venue_responses = [_venue_to_response(venue) for venue in venues]
-        
-        return WhereInspirationResponse(
-            suggestions=venue_responses,
-            total_count=len(venue_responses),
-            query=search_params.text_query,
+
+        # Venue structs already match the response schema, so serialize
+        # them directly with msgspec instead of re-validating via Pydantic
+        return Response(
+            content=msgspec.json.encode({
+                "suggestions": venues,
+                "total_count": len(venues),
+                "query": search_params.text_query,
+            }),
+            media_type="application/json",
         )
         
     except RateLimitError as e:
@@ -129,9 +144,7 @@ def _build_search_params(request: WhereInspirationRequest) -> SearchParams:
     prefs = request.preferences or {}
 
     # Check if 'what' contains location indicators
-    # Common patterns: "in Paris", "near Tokyo", "at Barcelona", "Milano", etc.
-    location_keywords = [' in ', ' near ', ' at ', ' around ']
-    has_location_in_text = any(keyword in request.what.lower() for keyword in location_keywords)
+    has_location_in_text = bool(_LOCATION_KEYWORD_RE.search(request.what))
 
     # Only use location bias if no location mentioned in text
     # This prevents conflicts where locationBias overrides the text query
@@ -162,33 +175,6 @@ def _build_search_params(request: WhereInspirationRequest) -> SearchParams:
     )
 
 
-def _venue_to_response(venue) -> VenueResponse:
-    """Convert Venue entity to VenueResponse schema."""
-    return VenueResponse(
-        place_id=venue.place_id,
-        name=venue.name,
-        display_name=venue.display_name,
-        address=venue.address,
-        location=LocationResponse(
-            latitude=venue.location.latitude,
-            longitude=venue.location.longitude,
-        ),
-        rating=venue.rating,
-        total_ratings=venue.total_ratings,
-        price_level=venue.price_level,
-        types=venue.types,
-        business_status=venue.business_status,
-        phone=venue.phone,
-        website=venue.website,
-        is_open_now=venue.is_open_now,
-        opening_hours=OpeningHoursResponse(
-            open_now=venue.opening_hours.open_now if venue.opening_hours else None,
-            weekday_descriptions=venue.opening_hours.weekday_descriptions if venue.opening_hours else None,
-        ) if venue.opening_hours else None,
-        google_maps_uri=venue.google_maps_uri,
-    )
-
-
 @router.post(
     "/wishlist",
     response_model=WishlistResponse,
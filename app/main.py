@@ -3,12 +3,25 @@ VAMU AI Service - Main FastAPI Application
 Provides AI-powered features for the VAMU platform.
 """
 import logging
+
+try:
+    # Apply the uvloop policy early so any entrypoint (gunicorn, scripts)
+    # gets the faster loop, not just uvicorn.run below
+    import uvloop
+    uvloop.install()
+except ImportError:
+    uvloop = None
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from app.config import settings
-from app.features.inspiration.presentation.router import router as inspiration_router
+from app.features.inspiration.presentation.router import (
+    router as inspiration_router,
+    get_groq_provider,
+    get_places_provider,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -24,6 +37,7 @@ app = FastAPI(
     description="AI-powered features for VAMU platform including venue suggestions, chatbot, and AI agents",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -72,6 +86,8 @@ async def startup_event():
 async def shutdown_event():
     """Run on application shutdown."""
     logger.info(f"Shutting down {settings.APP_NAME}")
+    await get_groq_provider().aclose()
+    await get_places_provider().close()
 
 # Global exception handler
 @app.exception_handler(Exception)
@@ -90,4 +106,6 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=settings.PORT,
         reload=settings.ENVIRONMENT == "development",
+        loop="uvloop" if uvloop else "auto",
+        http="httptools",
     )
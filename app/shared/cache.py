@@ -0,0 +1,68 @@
+"""
+Redis-backed caching for external API responses.
+"""
+import hashlib
+import json
+import logging
+from typing import Optional
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.config import runtime
+
+logger = logging.getLogger(__name__)
+
+
+class RedisResponseCache:
+    """
+    Exact-match response cache backed by Redis.
+
+    Cache failures are treated as misses so that a Redis outage never
+    breaks the request path - callers fall through to the upstream API.
+    """
+
+    def __init__(self, redis_url: str = None, default_ttl: int = 86400):
+        """
+        Initialize the cache.
+
+        Args:
+            redis_url: Redis connection URL. If not provided, uses runtime.REDIS_URL
+            default_ttl: Default expiry for cached entries, in seconds
+        """
+        self.redis_url = redis_url or runtime.REDIS_URL
+        self.default_ttl = default_ttl
+        self._redis = aioredis.from_url(self.redis_url, decode_responses=True)
+
+    @staticmethod
+    def make_key(payload: dict) -> str:
+        """
+        Build a deterministic cache key from a request payload.
+
+        Args:
+            payload: Request parameters that uniquely identify the response
+
+        Returns:
+            SHA-256 hex digest of the canonical JSON encoding
+        """
+        canonical = json.dumps(payload, sort_keys=True)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        """Get a cached value, or None on miss or Redis failure."""
+        try:
+            return await self._redis.get(key)
+        except (RedisError, OSError) as e:
+            logger.warning(f"Redis GET failed, treating as cache miss: {e}")
+            return None
+
+    async def set(self, key: str, value: str, ex: int = None) -> None:
+        """Store a value with expiry. Failures are logged and swallowed."""
+        try:
+            await self._redis.set(key, value, ex=ex or self.default_ttl)
+        except (RedisError, OSError) as e:
+            logger.warning(f"Redis SET failed, skipping cache write: {e}")
+
+    async def aclose(self) -> None:
+        """Close the Redis connection pool."""
+        await self._redis.aclose()